@@ -22,6 +22,16 @@ COMMON_FILE_EXTENSIONS = (
     ".xlsx",
 )
 
+# Keywords that can introduce a table/schema/catalog reference or definition.
+# Statements without any of these (e.g. "SELECT 1") are skipped without
+# parsing. This may over-match (e.g. "ORDER BY x DESC"), which is harmless.
+_SQL_REF_OR_DEF_KEYWORDS = re.compile(
+    r"\b(?:from|join|create|alter|drop|attach|insert|update|delete|truncate"
+    r"|copy|describe|desc|summarize|analyze|pivot|pivot_wider|unpivot"
+    r"|pivot_longer)\b",
+    re.IGNORECASE,
+)
+
 SQLKind = Literal["table", "view", "schema", "catalog"]
 
 SQLTypes = SQLKind | Literal["any"]
@@ -181,19 +191,23 @@ def find_sql_defs(sql_statement: str) -> SQLDefs:
     if not DependencyManager.duckdb.has():
         return SQLDefs()
 
+    if not _SQL_REF_OR_DEF_KEYWORDS.search(sql_statement):
+        return SQLDefs()
+
     import duckdb
 
     tokens = duckdb.tokenize(sql_statement)
     token_extractor = _TokenExtractor(
         sql_statement=sql_statement, tokens=tokens
     )
-    created_tables: list[SQLRef] = []
-    created_views: list[SQLRef] = []
-    created_schemas: list[str] = []
-    created_catalogs: list[str] = []
-
-    reffed_schemas: list[str] = []
-    reffed_catalogs: list[str] = []
+    # Insertion-ordered dicts dedupe names as they are collected
+    created_tables: dict[SQLRef, None] = {}
+    created_views: dict[SQLRef, None] = {}
+    created_schemas: dict[str, None] = {}
+    created_catalogs: dict[str, None] = {}
+
+    reffed_schemas: dict[str, None] = {}
+    reffed_catalogs: dict[str, None] = {}
     i = 0
 
     # See
@@ -261,28 +275,28 @@ def find_sql_defs(sql_statement: str) -> SQLDefs:
 
                     if is_table:
                         # only add the table name
-                        created_tables.append(SQLRef.from_parts(parts))
+                        created_tables[SQLRef.from_parts(parts)] = None
                         # add the catalog and schema if exist
                         if len(parts) == 3:
-                            reffed_catalogs.append(parts[0])
-                            reffed_schemas.append(parts[1])
+                            reffed_catalogs[parts[0]] = None
+                            reffed_schemas[parts[1]] = None
                         if len(parts) == 2:
-                            reffed_catalogs.append(parts[0])
+                            reffed_catalogs[parts[0]] = None
                     elif is_view:
                         # only add the table name
-                        created_views.append(SQLRef.from_parts(parts))
+                        created_views[SQLRef.from_parts(parts)] = None
                         # add the catalog and schema if exist
                         if len(parts) == 3:
-                            reffed_catalogs.append(parts[0])
-                            reffed_schemas.append(parts[1])
+                            reffed_catalogs[parts[0]] = None
+                            reffed_schemas[parts[1]] = None
                         if len(parts) == 2:
-                            reffed_catalogs.append(parts[0])
+                            reffed_catalogs[parts[0]] = None
                     elif is_schema:
                         # only add the schema name
-                        created_schemas.append(parts[-1])
+                        created_schemas[parts[-1]] = None
                         # add the catalog if exist
                         if len(parts) == 2:
-                            reffed_catalogs.append(parts[0])
+                            reffed_catalogs[parts[0]] = None
         elif token_extractor.is_keyword(i, "attach"):
             catalog_name = None
             i += 1
@@ -294,14 +308,13 @@ def find_sql_defs(sql_statement: str) -> SQLDefs:
                 catalog_name = token_extractor.strip_quotes(
                     token_extractor.token_str(i)
                 )
-                if "." in catalog_name:
-                    # e.g. "db.sqlite"
-                    # strip the extension from the name
-                    catalog_name = catalog_name.split(".")[0]
+                # e.g. "db.sqlite"
+                # strip the extension from the name (no-op without a ".")
+                catalog_name = catalog_name.partition(".")[0]
                 if ":" in catalog_name:
                     # e.g. "md:my_db"
                     # split on ":" and take the second part
-                    catalog_name = catalog_name.split(":")[1]
+                    catalog_name = catalog_name.split(":", 2)[1]
             if i + 1 < len(tokens) and token_extractor.is_keyword(i + 1, "as"):
                 # Skip over database-path 'AS'
                 i += 2
@@ -311,24 +324,22 @@ def find_sql_defs(sql_statement: str) -> SQLDefs:
                         token_extractor.token_str(i)
                     )
             if catalog_name is not None:
-                created_catalogs.append(catalog_name)
+                created_catalogs[catalog_name] = None
 
         i += 1
 
     # Remove 'memory' from catalogs, as this is the default and doesn't have a def
-    if "memory" in reffed_catalogs:
-        reffed_catalogs.remove("memory")
+    reffed_catalogs.pop("memory", None)
     # Remove 'main' from schemas, as this is the default and doesn't have a def
-    if "main" in reffed_schemas:
-        reffed_schemas.remove("main")
+    reffed_schemas.pop("main", None)
 
     return SQLDefs(
-        tables=created_tables,
-        views=created_views,
-        schemas=created_schemas,
-        catalogs=created_catalogs,
-        reffed_schemas=reffed_schemas,
-        reffed_catalogs=reffed_catalogs,
+        tables=list(created_tables),
+        views=list(created_views),
+        schemas=list(created_schemas),
+        catalogs=list(created_catalogs),
+        reffed_schemas=list(reffed_schemas),
+        reffed_catalogs=list(reffed_catalogs),
     )
 
 
@@ -503,9 +514,12 @@ def find_sql_refs(sql_statement: str) -> set[SQLRef]:
 
     DependencyManager.sqlglot.require(why="SQL parsing")
 
+    if not _SQL_REF_OR_DEF_KEYWORDS.search(sql_statement):
+        return set()
+
     from sqlglot import exp, parse
     from sqlglot.errors import OptimizeError
-    from sqlglot.optimizer.scope import build_scope
+    from sqlglot.optimizer.scope import traverse_scope
 
     def get_ref_from_table(table: exp.Table) -> SQLRef | None:
         # The variables might be empty strings, if they are, we set them to None
@@ -554,14 +568,19 @@ def find_sql_refs(sql_statement: str) -> set[SQLRef]:
         the top-level expression. Schema-qualified refs (e.g. schema.foo)
         are always real tables even if a CTE shares the same base name.
         """
+        # Collect CTEs and tables in a single walk, then filter
         cte_names: set[str] = set()
-        for cte in expression.find_all(exp.CTE):
-            with_node = cte.parent
+        tables: list[exp.Table] = []
+        for node in expression.find_all(exp.CTE, exp.Table):
+            if isinstance(node, exp.Table):
+                tables.append(node)
+                continue
+            with_node = node.parent
             if with_node and with_node.parent is expression:
-                alias = cte.alias
+                alias = node.alias
                 if alias:
                     cte_names.add(alias.lower())
-        for table in expression.find_all(exp.Table):
+        for table in tables:
             if ref := get_ref_from_table(table):
                 is_unqualified_cte = (
                     ref.table.lower() in cte_names
@@ -575,6 +594,24 @@ def find_sql_refs(sql_statement: str) -> set[SQLRef]:
         if expression is None:
             continue
 
+        # Without CTEs, every table in a query is a real reference, so a
+        # single walk is enough and we can skip building scopes.
+        if isinstance(expression, exp.Query):
+            query_tables: list[exp.Table] = []
+            for node in expression.find_all(exp.CTE, exp.Table):
+                # CTEs need scopes to be resolved, so stop at the first one
+                if not isinstance(node, exp.Table):
+                    break
+                query_tables.append(node)
+            else:
+                for table in query_tables:
+                    # Skip table functions, e.g. read_csv(...)
+                    if isinstance(table.this, exp.Func):
+                        continue
+                    if ref := get_ref_from_table(table):
+                        refs.add(ref)
+                continue
+
         if bool(
             expression.find(
                 exp.Update,
@@ -591,17 +628,25 @@ def find_sql_refs(sql_statement: str) -> set[SQLRef]:
         ):
             _collect_table_refs_excluding_ctes(expression)  # type: ignore[arg-type]
 
-        # build_scope only works for select statements.
+        # Scopes are only built for select statements.
         # It may raise OptimizeError for valid SQL with duplicate aliases
         # (e.g., "SELECT * FROM (SELECT 1 as x), (SELECT 2 as x)")
         # In that case, fall back to extracting table references directly.
         try:
-            if root := build_scope(expression):
-                for scope in root.traverse():  # type: ignore
-                    for _node, source in scope.selected_sources.values():
-                        if isinstance(source, exp.Table):
-                            if ref := get_ref_from_table(source):
-                                refs.add(ref)
+            for scope in traverse_scope(expression):  # type: ignore[arg-type]
+                # SQL identifiers are case-insensitive
+                cte_names = {name.lower() for name in scope.cte_sources}
+                for table in scope.tables:
+                    # Skip table functions, e.g. read_csv(...)
+                    if isinstance(table.this, exp.Func):
+                        continue
+                    # Skip references to CTEs, which aren't real tables.
+                    # CTE names are single identifiers, so qualified
+                    # tables can never refer to one.
+                    if not table.db and table.name.lower() in cte_names:
+                        continue
+                    if ref := get_ref_from_table(table):
+                        refs.add(ref)
         except OptimizeError:
             _collect_table_refs_excluding_ctes(expression)  # type: ignore[arg-type]
 
@@ -19,7 +19,6 @@ from marimo._sql.engines.types import (
     InferenceConfig,
     SQLConnection,
 )
-from marimo._sql.sql_quoting import quote_sql_identifier
 from marimo._sql.utils import convert_to_output, sql_type_to_data_type
 from marimo._types.ids import VariableName
 
@@ -38,6 +37,20 @@ WHY_PANDAS_REQUIRED = (
     "You may opt to choose Native output instead."
 )
 
+# Databases that only hold server metadata
+_META_DATABASES = frozenset({"system", "information_schema"})
+
+
+def _is_pandas_dataframe(value: Any) -> bool:
+    # A DataFrame can only be returned if pandas was already imported,
+    # so avoid importing it here.
+    if not DependencyManager.pandas.imported():
+        return False
+
+    import pandas as pd
+
+    return isinstance(value, pd.DataFrame)
+
 
 class ClickhouseEmbedded(SQLConnection[Optional["ChdbConnection"]]):
     """Use chdb to connect to an embedded Clickhouse"""
@@ -226,7 +239,6 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
         engine_name: VariableName | None = None,
     ) -> None:
         super().__init__(connection, engine_name)
-        self._meta_dbs = ["system", "information_schema"]
 
     @property
     def source(self) -> str:
@@ -334,20 +346,17 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
             LOGGER.info("Unable to get databases without pandas")
             return []
 
-        import pandas as pd
-
-        databases: list[Database] = []
         try:
             db_df = self._connection.query_df("SHOW DATABASES")
         except Exception:
             LOGGER.warning("Failed to get databases", exc_info=True)
-            return databases
+            return []
 
-        if not isinstance(db_df, pd.DataFrame):
+        if not _is_pandas_dataframe(db_df):
             LOGGER.warning(
                 f"Failed to convert database result to DataFrame, result: {db_df!s}"
             )
-            return databases
+            return []
 
         include_tables_bool = self._resolve_should_auto_discover(
             include_tables
@@ -358,40 +367,50 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
 
         # Assume the first column contains the database names.
         if db_df.empty:
-            return databases
-
-        db_names = db_df[db_df.columns[0]].tolist()
-        for db in db_names:
-            db_name = cast(str, db)
-            # Skip introspection for meta tables for performance
-            is_meta_db = db_name.lower() in self._meta_dbs
-            if is_meta_db or not include_tables_bool:
-                tables: list[DataTable] = []
-                tables_resolved = False
-            else:
-                tables, tables_resolved = (
-                    self._get_tables_in_schema_with_resolution(
-                        schema=NO_SCHEMA_NAME,
-                        database=db,
-                        include_table_details=include_table_details,
-                    )
-                )
-            databases.append(
-                Database(
-                    name=db,
-                    dialect=self.dialect,
-                    engine=self._engine_name,
-                    # ClickHouse does not have schemas
-                    schemas=[
-                        Schema(
-                            name=NO_SCHEMA_NAME,
-                            tables=tables,
-                            tables_resolved=tables_resolved,
-                        )
-                    ],
+            return []
+
+        return [
+            self._get_database(
+                cast(str, db),
+                include_tables=include_tables_bool,
+                include_table_details=include_table_details,
+            )
+            for db in db_df.iloc[:, 0].to_numpy()
+        ]
+
+    def _get_database(
+        self,
+        db_name: str,
+        *,
+        include_tables: bool,
+        include_table_details: bool,
+    ) -> Database:
+        # Skip introspection for meta tables for performance
+        is_meta_db = db_name.lower() in _META_DATABASES
+        if is_meta_db or not include_tables:
+            tables: list[DataTable] = []
+            tables_resolved = False
+        else:
+            tables, tables_resolved = (
+                self._get_tables_in_schema_with_resolution(
+                    schema=NO_SCHEMA_NAME,
+                    database=db_name,
+                    include_table_details=include_table_details,
                 )
             )
-        return databases
+        return Database(
+            name=db_name,
+            dialect=self.dialect,
+            engine=self._engine_name,
+            # ClickHouse does not have schemas
+            schemas=[
+                Schema(
+                    name=NO_SCHEMA_NAME,
+                    tables=tables,
+                    tables_resolved=tables_resolved,
+                )
+            ],
+        )
 
     def _is_cheap_discovery(self) -> bool:
         # TODO: Smartly determine if we should auto-discover
@@ -442,11 +461,18 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
         if self._connection is None:
             return [], False
 
+        if include_table_details:
+            return self._get_tables_with_details(
+                self._connection, database=database
+            )
+
         tables: list[DataTable] = []
         try:
-            quoted_db = quote_sql_identifier(database, dialect="clickhouse")
-            query = f"SHOW TABLES FROM {quoted_db}"
-            table_df = self._connection.query_df(query)
+            # Equivalent to SHOW TABLES, but with a bound parameter
+            query = "SELECT name FROM system.tables WHERE database = {database_name:String} ORDER BY name"
+            table_df = self._connection.query_df(
+                query, parameters={"database_name": database}
+            )
         except Exception:
             LOGGER.warning(
                 f"Failed to get tables from database {database}",
@@ -454,9 +480,7 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
             )
             return tables, False
 
-        import pandas as pd
-
-        if not isinstance(table_df, pd.DataFrame):
+        if not _is_pandas_dataframe(table_df):
             LOGGER.warning("Failed to convert table result to DataFrame")
             return tables, False
 
@@ -464,31 +488,136 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
             return tables, True
 
         # Assume the first column contains table names.
-        table_names = table_df[table_df.columns[0]].tolist()
+        table_names = table_df.iloc[:, 0].to_numpy()
         for table in table_names:
-            if include_table_details:
-                table_detail = self.get_table_details(
-                    table_name=table, schema_name="", database_name=database
+            tables.append(
+                DataTable(
+                    source_type="connection",
+                    source=self.dialect,
+                    name=table,
+                    num_rows=None,
+                    num_columns=None,
+                    variable_name=None,
+                    engine=self._engine_name,
+                    type="table",
+                    columns=[],
+                    primary_keys=[],
+                    indexes=[],
                 )
-                if table_detail is not None:
-                    tables.append(table_detail)
-            else:
-                tables.append(
-                    DataTable(
-                        source_type="connection",
-                        source=self.dialect,
-                        name=table,
-                        num_rows=None,
-                        num_columns=None,
-                        variable_name=None,
-                        engine=self._engine_name,
-                        type="table",
-                        columns=[],
-                        primary_keys=[],
-                        indexes=[],
-                    )
+            )
+        return tables, True
+
+    def _get_tables_with_details(
+        self, connection: ClickhouseClient, *, database: str
+    ) -> tuple[list[DataTable], bool]:
+        """
+        Return all tables in a database with their detailed metadata.
+
+        Fetches every table's metadata with one query against system.tables
+        and one against system.columns, instead of two queries per table.
+        """
+        try:
+            tables_df = connection.query_df(
+                "SELECT name, engine, primary_key, total_rows FROM system.tables WHERE database = {database_name:String} ORDER BY name",
+                parameters={"database_name": database},
+            )
+            columns_df = connection.query_df(
+                "SELECT table, name, type FROM system.columns WHERE database = {database_name:String} ORDER BY table, position",
+                parameters={"database_name": database},
+            )
+        except Exception:
+            LOGGER.warning(
+                f"Failed to get table details from database {database}",
+                exc_info=True,
+            )
+            return [], False
+
+        if not _is_pandas_dataframe(tables_df) or not _is_pandas_dataframe(
+            columns_df
+        ):
+            LOGGER.warning(
+                "Failed to convert table details result to DataFrame"
+            )
+            return [], False
+
+        columns_by_table: dict[str, list[DataTableColumn]] = {}
+        for table_name, col_name, col_type in zip(
+            columns_df["table"],
+            columns_df["name"],
+            columns_df["type"],
+            strict=True,
+        ):
+            col_type_str = str(col_type)
+            columns_by_table.setdefault(str(table_name), []).append(
+                DataTableColumn(
+                    name=str(col_name),
+                    type=sql_type_to_data_type(col_type_str),
+                    external_type=col_type_str,
+                    sample_values=[],
+                )
+            )
+
+        tables: list[DataTable] = []
+        for table_name, engine, primary_key, total_rows in zip(
+            tables_df["name"],
+            tables_df["engine"],
+            tables_df["primary_key"],
+            tables_df["total_rows"],
+            strict=True,
+        ):
+            cols = columns_by_table.get(str(table_name))
+            # Matches get_table_details, which skips tables without columns
+            if not cols:
+                continue
+            tables.append(
+                self._to_data_table(
+                    table_name=str(table_name),
+                    engine=engine,
+                    primary_key=primary_key,
+                    total_rows=total_rows,
+                    cols=cols,
                 )
-        return tables, len(tables) == len(table_names)
+            )
+        return tables, len(tables) == len(tables_df)
+
+    def _to_data_table(
+        self,
+        *,
+        table_name: str,
+        engine: Any,
+        primary_key: Any,
+        total_rows: Any,
+        cols: list[DataTableColumn],
+    ) -> DataTable:
+        """Build a DataTable from a row of system.tables and its columns."""
+        primary_keys: list[str] = []
+        if primary_key:
+            primary_keys.append(primary_key)
+
+        table_type: DataTableType = "table"
+        if engine and str(engine).lower() == "view":
+            table_type = (
+                "view"  # TODO: We should add support for general table types
+            )
+
+        try:
+            num_rows = int(total_rows) if total_rows is not None else None
+        except Exception:
+            num_rows = None
+
+        return DataTable(
+            source_type="connection",
+            source=self.dialect,
+            name=table_name,
+            num_rows=num_rows,
+            num_columns=len(cols),
+            variable_name=None,
+            engine=self._engine_name,
+            type=table_type,
+            columns=cols,
+            primary_keys=primary_keys,
+            indexes=[],  # TODO
+        )
 
     def get_table_details(
         self,
@@ -532,39 +661,32 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
             )
             return None
 
-        import pandas as pd
-
-        if not isinstance(table_df, pd.DataFrame):
+        if not _is_pandas_dataframe(table_df):
             LOGGER.warning(
                 "Failed to convert table description result to DataFrame"
             )
             return None
 
-        primary_keys: list[str] = []
+        primary_key = None
+        engine = None
         total_rows = None
-        table_type: DataTableType = "table"
         try:
             primary_key = table_df["primary_key"].iloc[0]
-            if primary_key:
-                primary_keys.append(primary_key)
-
             engine = table_df["engine"].iloc[0]
-            if engine and str(engine).lower() == "view":
-                table_type = "view"  # TODO: We should add support for general table types
-
             total_rows = table_df["total_rows"].iloc[0]
         except Exception:
             pass
 
         try:
-            quoted_db = quote_sql_identifier(
-                database_name, dialect="clickhouse"
-            )
-            quoted_table = quote_sql_identifier(
-                table_name, dialect="clickhouse"
+            # Equivalent to DESCRIBE TABLE, but with bound parameters
+            query = "SELECT name, type FROM system.columns WHERE database = {database_name:String} AND table = {table_name:String} ORDER BY position"
+            desc_df = self._connection.query_df(
+                query,
+                parameters={
+                    "table_name": table_name,
+                    "database_name": database_name,
+                },
             )
-            query = f"DESCRIBE TABLE {quoted_db}.{quoted_table}"
-            desc_df = self._connection.query_df(query)
         except Exception:
             LOGGER.warning(
                 f"Failed to get table description for {table_name} in database {database_name}",
@@ -572,7 +694,7 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
             )
             return None
 
-        if not isinstance(desc_df, pd.DataFrame):
+        if not _is_pandas_dataframe(desc_df):
             LOGGER.warning(
                 "Failed to convert table description result to DataFrame"
             )
@@ -582,38 +704,27 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
             return None
 
         cols: list[DataTableColumn] = []
-        for _, row in desc_df.iterrows():
-            col_name = row.get("name")
+        for col_name, col_type in zip(
+            desc_df["name"], desc_df["type"], strict=True
+        ):
             if col_name is None:
                 continue
-            col_type_str = str(row.get("type", "string"))
-            data_type = sql_type_to_data_type(col_type_str)
+            col_type_str = str(col_type)
             cols.append(
                 DataTableColumn(
                     name=str(col_name),
-                    type=data_type,
+                    type=sql_type_to_data_type(col_type_str),
                     external_type=col_type_str,
                     sample_values=[],
                 )
             )
 
-        try:
-            total_rows = int(total_rows) if total_rows is not None else None
-        except Exception:
-            total_rows = None
-
-        return DataTable(
-            source_type="connection",
-            source=self.dialect,
-            name=table_name,
-            num_rows=total_rows,
-            num_columns=len(cols),
-            variable_name=None,
-            engine=self._engine_name,
-            type=table_type,
-            columns=cols,
-            primary_keys=primary_keys,
-            indexes=[],  # TODO
+        return self._to_data_table(
+            table_name=table_name,
+            engine=engine,
+            primary_key=primary_key,
+            total_rows=total_rows,
+            cols=cols,
         )
 
     def get_default_database(self) -> str | None:
@@ -630,9 +741,7 @@ class ClickhouseServer(SQLConnection[Optional["ClickhouseClient"]]):
             LOGGER.warning("Failed to get current database", exc_info=True)
             return None
 
-        import pandas as pd
-
-        if not isinstance(db_name, pd.DataFrame):
+        if not _is_pandas_dataframe(db_name):
             return None
 
         if db_name.empty:
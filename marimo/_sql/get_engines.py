@@ -1,6 +1,7 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, cast
 
 from marimo import _loggers
@@ -51,6 +52,10 @@ def get_engines_from_variables(
     engines: list[tuple[VariableName, BaseEngine[Any]]] = []
 
     for variable_name, value in variables:
+        # Builtin values (numbers, strings, containers, functions, classes,
+        # modules, ...) are never engines, so skip the per-engine checks.
+        if type(value).__module__ == "builtins":
+            continue
         for sql_engine in SUPPORTED_ENGINES:
             if sql_engine.is_compatible(value):
                 engines.append(
@@ -130,13 +135,22 @@ def get_datasources_config() -> DatasourcesConfig:
         )
 
     try:
-        return (
-            get_default_config_manager(current_path=None)
-            .get_config()
-            .get("datasources", {})
-        )
+        # Copy so callers can't mutate the cached config
+        return _get_default_datasources_config().copy()
     except Exception as e:
         LOGGER.warning(
             f"Failed to get datasources config from default config: {e}. Returning empty config."
         )
         return {}
+
+
+# Reading the default config hits the disk, so we cache it. Outside of a
+# kernel, config changes are picked up after a restart. Failed reads raise
+# and are not cached, so they are retried on the next call.
+@lru_cache(maxsize=1)
+def _get_default_datasources_config() -> DatasourcesConfig:
+    return (
+        get_default_config_manager(current_path=None)
+        .get_config()
+        .get("datasources", {})
+    )
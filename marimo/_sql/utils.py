@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from contextlib import nullcontext
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
 from marimo import _loggers
@@ -306,6 +307,8 @@ def raise_df_import_error(pkg: str) -> None:
     )
 
 
+# Column types repeat heavily across a schema (e.g. many Int32 columns)
+@lru_cache(maxsize=128)
 def sql_type_to_data_type(type_str: str) -> DataType:
     """Convert SQL type string to DataType"""
     type_str = type_str.lower()
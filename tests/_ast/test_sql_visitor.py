@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ast
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
 
@@ -417,6 +418,23 @@ class TestFindSQLDefs:
             reffed_schemas=[],  # main not included, since that is the default
         )
 
+    @staticmethod
+    def test_find_sql_defs_deduplicates() -> None:
+        sql = """
+        CREATE TABLE memory.main.t1 (id INT);
+        CREATE TABLE memory.main.t2 (id INT);
+        CREATE OR REPLACE TABLE memory.main.t1 (id INT);
+        """
+        assert find_sql_defs(sql) == SQLDefs(
+            tables=[
+                SQLRef(table="t1", catalog="memory", schema="main"),
+                SQLRef(table="t2", catalog="memory", schema="main"),
+            ],
+            # memory and main are defaults, so every occurrence is removed
+            reffed_catalogs=[],
+            reffed_schemas=[],
+        )
+
     @staticmethod
     def test_find_sql_defs_create_schema() -> None:
         sql = """
@@ -583,6 +601,20 @@ class TestFindSQLRefs:
         """
         assert find_sql_refs(sql) == {SQLRef(table="source_table")}
 
+    def test_with_cte_case_mismatch(self) -> None:
+        # Unquoted identifiers are case-insensitive, so a reference whose
+        # case differs from the CTE name still refers to the CTE
+        sql = """
+        WITH C AS (
+            SELECT * FROM source_table
+        )
+        SELECT * FROM c;
+        """
+        assert find_sql_refs(sql) == {SQLRef(table="source_table")}
+
+        sql = "WITH foo AS (SELECT 1) SELECT * FROM FOO"
+        assert find_sql_refs(sql) == set()
+
     def test_with_union(self) -> None:
         sql = """
         SELECT * FROM table1
@@ -1111,3 +1143,31 @@ class TestFindSQLRefs:
             SQLRef(table="table1"),
             SQLRef(table="table2"),
         }
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT 1",
+            "VALUES (1, 'a'), (2, 'b')",
+            "-- just a comment",
+            "SELECT 42 AS from_date",
+        ],
+    )
+    def test_skips_parsing_without_ref_keywords(self, sql: str) -> None:
+        with patch("sqlglot.parse") as mock_parse:
+            assert find_sql_refs(sql) == set()
+        mock_parse.assert_not_called()
+
+    def test_schema_qualified_table_same_name_as_cte_in_scope(self) -> None:
+        # Same as above, but without duplicate aliases so refs are
+        # collected from the scopes rather than the fallback walk.
+        sql = """
+        WITH foo AS (SELECT id FROM source)
+        SELECT *
+        FROM schema1.foo
+            JOIN foo a ON schema1.foo.id = a.id
+        """
+        assert find_sql_refs(sql) == {
+            SQLRef(table="source"),
+            SQLRef(table="foo", schema="schema1"),
+        }
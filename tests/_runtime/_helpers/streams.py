@@ -72,6 +72,13 @@ class MockStream(ThreadSafeStream):
             op for op in self.operations if isinstance(op, CellNotification)
         ]
 
+    def contains_output(self, needle: str) -> bool:
+        return any(
+            needle in notification.output.data
+            for notification in self.cell_notifications
+            if notification.output is not None
+        )
+
 
 class MockStdout(ThreadSafeStdout):
     """Captures stdout writes as a list of strings."""
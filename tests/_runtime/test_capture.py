@@ -1,155 +1,167 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
-import json
-import re
+import textwrap
 
-from marimo._messaging.types import KernelMessage
-from tests.conftest import ExecReqProvider, MockedKernel
-
-
-def _has_output(messages: list[KernelMessage], pattern: str) -> bool:
-    for data in messages:
-        data = json.loads(data)
-        if (
-            data["op"] == "cell-op"
-            and data["output"] is not None
-            and re.match(pattern, data["output"]["data"])
-        ):
-            return True
-    return False
-
-
-async def test_capture_stdout(
-    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
-) -> None:
-    await mocked_kernel.k.run(
-        [
-            exec_req.get(
-                """
-                import marimo as mo
-                import sys
-                with mo.capture_stdout() as buffer:
-                    sys.stdout.write('hello')
-                    sys.stderr.write('bye')
-                """
-            )
-        ]
-    )
-    assert not mocked_kernel.stdout.messages
-    assert mocked_kernel.stderr.messages == ["bye"]
-    assert mocked_kernel.k.globals["buffer"].getvalue() == "hello"
-
-
-async def test_capture_stderr(
-    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
-) -> None:
-    await mocked_kernel.k.run(
-        [
-            exec_req.get(
-                """
-                import marimo as mo
-                import sys
-                with mo.capture_stderr() as buffer:
-                    sys.stdout.write('hello')
-                    sys.stderr.write('bye')
-                """
-            )
-        ]
-    )
-    assert mocked_kernel.stdout.messages == ["hello"]
-    assert not mocked_kernel.stderr.messages
-    assert mocked_kernel.k.globals["buffer"].getvalue() == "bye"
-
-
-async def test_capture_both(
-    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
-) -> None:
-    await mocked_kernel.k.run(
-        [
-            # in python < 3.9, parenthesizing multiple context managers is
-            # not allowed, hence the line continuation
-            exec_req.get(
-                """
-                import marimo as mo
-                import sys
-                with mo.capture_stderr() as stderr, \
-                     mo.capture_stdout() as stdout:
-                    sys.stdout.write('hello')
-                    sys.stderr.write('bye')
-                """
-            )
-        ]
-    )
-    assert not mocked_kernel.stdout.messages
-    assert not mocked_kernel.stderr.messages
-    assert mocked_kernel.k.globals["stdout"].getvalue() == "hello"
-    assert mocked_kernel.k.globals["stderr"].getvalue() == "bye"
-
-
-async def test_redirect_stdout(
-    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
-) -> None:
-    await mocked_kernel.k.run(
-        [
-            exec_req.get(
-                """
-                import marimo as mo
-                import sys
-                with mo.redirect_stdout():
-                    sys.stdout.write('hello')
-                    sys.stderr.write('bye')
-                """
-            )
-        ]
-    )
-    assert not mocked_kernel.stdout.messages
-    assert mocked_kernel.stderr.messages == ["bye"]
-    assert _has_output(mocked_kernel.stream.messages, r".*hello.*")
-    assert not _has_output(mocked_kernel.stream.messages, r".*bye.*")
-
-
-async def test_redirect_stderr(
-    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
-) -> None:
-    await mocked_kernel.k.run(
-        [
-            exec_req.get(
-                """
-                import marimo as mo
-                import sys
-                with mo.redirect_stderr():
-                    sys.stdout.write('hello')
-                    sys.stderr.write('bye')
-                """
-            )
-        ]
-    )
-    assert mocked_kernel.stdout.messages == ["hello"]
-    assert not mocked_kernel.stderr.messages
-
-    assert _has_output(mocked_kernel.stream.messages, r".*bye.*")
-    assert not _has_output(mocked_kernel.stream.messages, r".*hello.*")
+import pytest
 
+from marimo._runtime.commands import ExecuteCellCommand
+from marimo._types.ids import CellId_t
+from tests.conftest import ExecReqProvider, MockedKernel
 
-async def test_redirect_both(
-    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+# imports shared by every case, run once in a setup cell on the shared kernel
+_SETUP_CELL_ID = CellId_t("imports")
+_SRC_SETUP = "import marimo as mo\nimport sys"
+
+_SRC_CAPTURE_STDOUT = textwrap.dedent(
+    """
+    with mo.capture_stdout() as buffer:
+        sys.stdout.write('hello')
+        sys.stderr.write('bye')
+    """
+).strip()
+
+_SRC_CAPTURE_STDERR = textwrap.dedent(
+    """
+    with mo.capture_stderr() as buffer:
+        sys.stdout.write('hello')
+        sys.stderr.write('bye')
+    """
+).strip()
+
+# in python < 3.9, parenthesizing multiple context managers is
+# not allowed, hence the line continuation
+_SRC_CAPTURE_BOTH = textwrap.dedent(
+    """
+    with mo.capture_stderr() as stderr, \
+         mo.capture_stdout() as stdout:
+        sys.stdout.write('hello')
+        sys.stderr.write('bye')
+    """
+).strip()
+
+_SRC_REDIRECT_STDOUT = textwrap.dedent(
+    """
+    with mo.redirect_stdout():
+        sys.stdout.write('hello')
+        sys.stderr.write('bye')
+    """
+).strip()
+
+_SRC_REDIRECT_STDERR = textwrap.dedent(
+    """
+    with mo.redirect_stderr():
+        sys.stdout.write('hello')
+        sys.stderr.write('bye')
+    """
+).strip()
+
+_SRC_REDIRECT_BOTH = textwrap.dedent(
+    """
+    with mo.redirect_stdout(), mo.redirect_stderr():
+        sys.stdout.write('hello')
+        sys.stderr.write('bye')
+    """
+).strip()
+
+
+@pytest.fixture(autouse=True)
+async def _reset_streams(mocked_kernel_module: MockedKernel) -> None:
+    # The kernel is shared across tests; the setup cell only runs once and
+    # the captured output is reset before each test
+    if _SETUP_CELL_ID not in mocked_kernel_module.k.graph.cells:
+        await mocked_kernel_module.k.run(
+            [ExecuteCellCommand(cell_id=_SETUP_CELL_ID, code=_SRC_SETUP)]
+        )
+    mocked_kernel_module.stdout.messages.clear()
+    mocked_kernel_module.stderr.messages.clear()
+    mocked_kernel_module.stream.messages.clear()
+
+
+@pytest.mark.parametrize(
+    (
+        "code",
+        "stdout",
+        "stderr",
+        "buffers",
+        "stream_has",
+        "stream_hasnt",
+    ),
+    [
+        pytest.param(
+            _SRC_CAPTURE_STDOUT,
+            [],
+            ["bye"],
+            {"buffer": "hello"},
+            [],
+            [],
+            id="capture_stdout",
+        ),
+        pytest.param(
+            _SRC_CAPTURE_STDERR,
+            ["hello"],
+            [],
+            {"buffer": "bye"},
+            [],
+            [],
+            id="capture_stderr",
+        ),
+        pytest.param(
+            _SRC_CAPTURE_BOTH,
+            [],
+            [],
+            {"stdout": "hello", "stderr": "bye"},
+            [],
+            [],
+            id="capture_both",
+        ),
+        pytest.param(
+            _SRC_REDIRECT_STDOUT,
+            [],
+            ["bye"],
+            {},
+            ["hello"],
+            ["bye"],
+            id="redirect_stdout",
+        ),
+        pytest.param(
+            _SRC_REDIRECT_STDERR,
+            ["hello"],
+            [],
+            {},
+            ["bye"],
+            ["hello"],
+            id="redirect_stderr",
+        ),
+        pytest.param(
+            _SRC_REDIRECT_BOTH,
+            [],
+            [],
+            {},
+            ["bye", "hello"],
+            [],
+            id="redirect_both",
+        ),
+    ],
+)
+async def test_capture_and_redirect(
+    mocked_kernel_module: MockedKernel,
+    exec_req: ExecReqProvider,
+    code: str,
+    stdout: list[str],
+    stderr: list[str],
+    buffers: dict[str, str],
+    stream_has: list[str],
+    stream_hasnt: list[str],
 ) -> None:
-    await mocked_kernel.k.run(
-        [
-            exec_req.get(
-                """
-                import marimo as mo
-                import sys
-                with mo.redirect_stdout(), mo.redirect_stderr():
-                    sys.stdout.write('hello')
-                    sys.stderr.write('bye')
-                """
-            )
-        ]
-    )
-    assert not mocked_kernel.stdout.messages
-    assert not mocked_kernel.stderr.messages
-
-    assert _has_output(mocked_kernel.stream.messages, r".*bye.*")
-    assert _has_output(mocked_kernel.stream.messages, r".*hello.*")
+    await mocked_kernel_module.k.run([exec_req.get(code)])
+
+    assert mocked_kernel_module.stdout.messages == stdout
+    assert mocked_kernel_module.stderr.messages == stderr
+    for name, value in buffers.items():
+        assert mocked_kernel_module.k.globals[name].getvalue() == value
+    stream = mocked_kernel_module.stream
+    for needle in stream_has:
+        assert stream.contains_output(needle)
+    for needle in stream_hasnt:
+        assert not stream.contains_output(needle)
@@ -33,7 +33,7 @@ def test_clickhouse_get_databases_marks_failed_table_loading_unresolved() -> (
             del parameters
             if query == "SHOW DATABASES":
                 return pd.DataFrame({"name": ["default"]})
-            if query.startswith("SHOW TABLES"):
+            if "FROM system.tables" in query:
                 raise RuntimeError("failed to list tables")
             raise AssertionError(f"Unexpected query: {query}")
 
@@ -63,9 +63,7 @@ def test_clickhouse_get_databases_marks_failed_table_details_unresolved() -> (
             del parameters
             if query == "SHOW DATABASES":
                 return pd.DataFrame({"name": ["default"]})
-            if query.startswith("SHOW TABLES"):
-                return pd.DataFrame({"name": ["my_table"]})
-            if "system.tables" in query or query.startswith("DESCRIBE TABLE"):
+            if "system.tables" in query or "system.columns" in query:
                 raise RuntimeError("failed to load table details")
             raise AssertionError(f"Unexpected query: {query}")
 
@@ -82,6 +80,113 @@ def test_clickhouse_get_databases_marks_failed_table_details_unresolved() -> (
     assert schema.tables_resolved is False
 
 
+@pytest.mark.skipif(not HAS_PANDAS, reason="Pandas not installed")
+def test_clickhouse_get_databases_batches_table_details() -> None:
+    import pandas as pd
+
+    queries: list[str] = []
+
+    class Connection:
+        def query_df(
+            self, query: str, parameters: dict[str, str] | None = None
+        ) -> Any:
+            queries.append(query)
+            if query == "SHOW DATABASES":
+                return pd.DataFrame({"name": ["default"]})
+            assert parameters == {"database_name": "default"}
+            if "FROM system.tables" in query:
+                # Rows come back in server order unless the query sorts them
+                tables = pd.DataFrame(
+                    {
+                        "name": ["events_view", "events"],
+                        "engine": ["View", "MergeTree"],
+                        "primary_key": ["", "id"],
+                        "total_rows": [None, 10],
+                    }
+                )
+                if "ORDER BY name" in query:
+                    tables = tables.sort_values("name")
+                return tables
+            if "FROM system.columns" in query:
+                return pd.DataFrame(
+                    {
+                        "table": ["events", "events", "events_view"],
+                        "name": ["id", "ts", "id"],
+                        "type": ["UInt64", "DateTime", "UInt64"],
+                    }
+                )
+            raise AssertionError(f"Unexpected query: {query}")
+
+    engine = ClickhouseServer(Connection())  # type: ignore[arg-type]
+
+    databases = engine.get_databases(
+        include_schemas=True,
+        include_tables=True,
+        include_table_details=True,
+    )
+
+    # One query for the databases, then two for all of the table details
+    assert len(queries) == 3
+    schema = databases[0].schemas[0]
+    assert schema.tables_resolved is True
+    # Sorted by name, like the listing without table details
+    assert [t.name for t in schema.tables] == ["events", "events_view"]
+    events, events_view = schema.tables
+    assert events.name == "events"
+    assert events.type == "table"
+    assert events.num_rows == 10
+    assert events.primary_keys == ["id"]
+    assert [(c.name, c.type, c.external_type) for c in events.columns] == [
+        ("id", "integer", "UInt64"),
+        ("ts", "datetime", "DateTime"),
+    ]
+    assert events_view.name == "events_view"
+    assert events_view.type == "view"
+    assert events_view.num_rows is None
+    assert events_view.primary_keys == []
+    assert events_view.num_columns == 1
+
+
+@pytest.mark.skipif(not HAS_PANDAS, reason="Pandas not installed")
+def test_clickhouse_get_table_details_binds_parameters() -> None:
+    import pandas as pd
+
+    table_name = "it's"
+
+    class Connection:
+        def query_df(
+            self, query: str, parameters: dict[str, str] | None = None
+        ) -> Any:
+            # Names are bound server-side, never interpolated
+            assert table_name not in query
+            assert parameters == {
+                "table_name": table_name,
+                "database_name": "default",
+            }
+            if "FROM system.tables" in query:
+                return pd.DataFrame(
+                    {
+                        "engine": ["MergeTree"],
+                        "primary_key": [""],
+                        "total_rows": [3],
+                    }
+                )
+            if "FROM system.columns" in query:
+                return pd.DataFrame({"name": ["id"], "type": ["Int32"]})
+            raise AssertionError(f"Unexpected query: {query}")
+
+    engine = ClickhouseServer(Connection())  # type: ignore[arg-type]
+
+    table = engine.get_table_details(
+        table_name=table_name, schema_name="", database_name="default"
+    )
+
+    assert table is not None
+    assert table.name == table_name
+    assert table.num_rows == 3
+    assert [(c.name, c.type) for c in table.columns] == [("id", "integer")]
+
+
 @pytest.mark.skipif(
     not HAS_CLICKHOUSE_CONNECT, reason="Clickhouse connect not installed"
 )
@@ -422,6 +422,10 @@ def test_sql_type_to_data_type() -> None:
     # Test unknown type
     assert sql_type_to_data_type("UNKNOWN_TYPE") == "string"
 
+    # Wrapped and multi-word types
+    assert sql_type_to_data_type("Nullable(DateTime64(3))") == "datetime"
+    assert sql_type_to_data_type("time with time zone") == "time"
+
 
 @pytest.mark.requires("sqlalchemy")
 def test_sqlalchemy_type_conversion() -> None:
@@ -20,7 +20,9 @@ from marimo._sql.engines.ibis import IbisEngine
 from marimo._sql.engines.redshift import RedshiftEngine
 from marimo._sql.engines.sqlalchemy import SQLAlchemyEngine
 from marimo._sql.get_engines import (
+    _get_default_datasources_config,
     engine_to_data_source_connection,
+    get_datasources_config,
     get_engines_from_variables,
 )
 from marimo._sql.sql import sql
@@ -482,3 +484,57 @@ def test_variables_without_datasource_engine() -> None:
     variables = [("deferred_for_test", deferred_for_test)]
     engines = get_engines_from_variables(variables)
     assert not engines
+
+
+def test_get_datasources_config_caches_default_config() -> None:
+    _get_default_datasources_config.cache_clear()
+    config_manager = MagicMock()
+    config_manager.get_config.return_value = {
+        "datasources": {"auto_discover_tables": False}
+    }
+    with patch(
+        "marimo._sql.get_engines.get_default_config_manager",
+        return_value=config_manager,
+    ) as mock_get_config_manager:
+        # Outside of a kernel, fall back to the default config
+        assert get_datasources_config() == {"auto_discover_tables": False}
+        assert get_datasources_config() == {"auto_discover_tables": False}
+
+    mock_get_config_manager.assert_called_once()
+    _get_default_datasources_config.cache_clear()
+
+
+def test_get_datasources_config_retries_failed_default_config() -> None:
+    _get_default_datasources_config.cache_clear()
+    config_manager = MagicMock()
+    config_manager.get_config.side_effect = [
+        OSError("config unreadable"),
+        {"datasources": {"auto_discover_tables": False}},
+    ]
+    with patch(
+        "marimo._sql.get_engines.get_default_config_manager",
+        return_value=config_manager,
+    ):
+        # A failed read falls back to an empty config but isn't cached
+        assert get_datasources_config() == {}
+        config = get_datasources_config()
+        assert config == {"auto_discover_tables": False}
+
+        # Callers get a copy of the cached config
+        config["auto_discover_tables"] = True
+        assert get_datasources_config() == {"auto_discover_tables": False}
+
+    _get_default_datasources_config.cache_clear()
+
+
+def test_get_engines_from_variables_skips_builtins() -> None:
+    variables = [
+        (VariableName("x"), 1),
+        (VariableName("name"), "SELECT 1"),
+        (VariableName("rows"), [1, 2, 3]),
+        (VariableName("fn"), len),
+        (VariableName("cls"), dict),
+    ]
+    with patch.object(DBAPIEngine, "is_compatible") as mock_is_compatible:
+        assert get_engines_from_variables(variables) == []
+    mock_is_compatible.assert_not_called()
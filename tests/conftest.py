@@ -365,6 +365,15 @@ def mocked_kernel() -> Generator[MockedKernel, None, None]:
     mocked.teardown()
 
 
+# module-scoped variant of mocked_kernel, shared by all tests in a module;
+# tests are responsible for resetting any state they depend on
+@pytest.fixture(scope="module")
+def mocked_kernel_module() -> Generator[MockedKernel, None, None]:
+    mocked = MockedKernel.open()
+    yield mocked
+    mocked.teardown()
+
+
 # Installs an execution context without stream redirection
 @pytest.fixture
 def executing_kernel() -> Generator[Kernel, None, None]: